@@ -4,9 +4,13 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 from gi.repository import Gtk, Adw, Gdk, Gio, GLib, Pango
 
+import functools
 import gettext
+import hashlib
+import itertools
 import locale
 import os
+import queue
 import sys
 import json
 import datetime
@@ -15,8 +19,16 @@ import subprocess
 import re
 import tempfile
 import shutil
+import signal
+from concurrent.futures import Future
+from typing import NamedTuple
 from rpm_policy_checker.accessibility import AccessibilityManager
 
+try:
+    import rpm
+except ImportError:
+    rpm = None  # fall back to the rpm command line tool
+
 LOCALE_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "po")
 if not os.path.isdir(LOCALE_DIR):
     LOCALE_DIR = "/usr/share/locale"
@@ -24,6 +36,13 @@ locale.bindtextdomain("rpm-policy-checker", LOCALE_DIR)
 gettext.bindtextdomain("rpm-policy-checker", LOCALE_DIR)
 gettext.textdomain("rpm-policy-checker")
 _ = gettext.gettext
+ngettext = gettext.ngettext
+
+
+def N_(message):
+    """Mark a string for translation without translating it yet."""
+    return message
+
 
 APP_ID = "se.danielnylander.rpm-policy-checker"
 SETTINGS_DIR = os.path.join(
@@ -31,25 +50,27 @@ SETTINGS_DIR = os.path.join(
     "rpm-policy-checker"
 )
 SETTINGS_FILE = os.path.join(SETTINGS_DIR, "settings.json")
+CACHE_DIR = os.path.join(SETTINGS_DIR, "cache")
 
-# Check categories
+# Check categories; names are translated when displayed
 CATEGORIES = {
-    "naming": _("Package Naming"),
-    "spec-quality": _("Spec File Quality"),
-    "dependencies": _("Dependencies"),
-    "file-placement": _("File Placement"),
-    "licensing": _("Licensing (SPDX)"),
-    "scriptlets": _("Scriptlets"),
-    "macros": _("Macro Usage"),
-    "changelog": _("Changelog Format"),
-    "rpmlint": _("rpmlint Results"),
-    "general": _("General"),
+    "naming": N_("Package Naming"),
+    "spec-quality": N_("Spec File Quality"),
+    "dependencies": N_("Dependencies"),
+    "file-placement": N_("File Placement"),
+    "licensing": N_("Licensing (SPDX)"),
+    "scriptlets": N_("Scriptlets"),
+    "macros": N_("Macro Usage"),
+    "changelog": N_("Changelog Format"),
+    "rpmlint": N_("rpmlint Results"),
+    "general": N_("General"),
 }
 
 SEVERITY_ICONS = {"E": "❌", "W": "⚠️", "I": "ℹ️", "N": "📝", "P": "🔍"}
-SEVERITY_NAMES = {}  # populated at runtime after gettext is ready
+SEVERITY_CSS = {"E": ("caption", "error"), "W": ("caption", "warning")}
 
 
+@functools.lru_cache(maxsize=1)
 def _get_severity_names():
     return {
         "E": _("Error"),
@@ -75,523 +96,739 @@ def _save_settings(s):
 
 # ── RPM checking logic ──────────────────────────────────────────────
 
+class Finding(NamedTuple):
+    """A single policy check result."""
+    category: str
+    severity: str
+    tag: str
+    detail: str
+    package: str = ""
+    recommendation: str = ""
+
+
+def _emit(results, category, severity, tag, detail, package="", recommendation=""):
+    """Append a Finding to results."""
+    results.append(Finding(category, severity, tag, detail, package, recommendation))
+
+
+_RPMLINT_TIMEOUT = 120  # seconds
+
+# rpmlint output: "package: severity: tag detail"
+_RPMLINT_FULL_RE = re.compile(r'^(.+?):\s*(\w):\s*(\S+)\s*(.*)')
+# Simpler rpmlint output: "tag: detail"
+_RPMLINT_SIMPLE_RE = re.compile(r'^(\S+):\s*(.*)')
+# Expected: * Day Mon DD YYYY Name <email> - version
+_CHANGELOG_RE = re.compile(r'^\*\s+\w+\s+\w+\s+\d+\s+\d{4}\s+.+\s+<.+@.+>')
+_LICENSE_SPLIT_RE = re.compile(r'\s+(?:AND|OR|and|or)\s+')
+# "URL         : https://..." line of rpm -qpi output
+_RPM_INFO_URL_RE = re.compile(r'^URL[ \t]*:[ \t]*(.*)$', re.M)
+
+
+# Findings with fixed text, built once and shared by every report
+_RPMLINT_NOT_INSTALLED_RESULT = Finding(
+    category="rpmlint",
+    severity="E",
+    tag="rpmlint-not-installed",
+    detail=_("rpmlint is not installed."),
+    recommendation=_("Install with: sudo dnf install rpmlint"),
+)
+_MISSING_DIST_TAG_RESULT = Finding(
+    category="spec-quality",
+    severity="W",
+    tag="missing-dist-tag",
+    detail=_("Release field does not contain %%{?dist}."),
+    recommendation=_("Add %%{?dist} to the Release tag for proper distribution tagging."),
+)
+_SUMMARY_ENDS_WITH_DOT_RESULT = Finding(
+    category="spec-quality",
+    severity="W",
+    tag="summary-ends-with-dot",
+    detail=_("Summary should not end with a period."),
+    recommendation=_("Remove the trailing period from the Summary."),
+)
+_SUMMARY_TOO_LONG_RESULT = Finding(
+    category="spec-quality",
+    severity="W",
+    tag="summary-too-long",
+    detail=_("Summary exceeds 80 characters."),
+    recommendation=_("Keep the Summary concise (under 80 characters)."),
+)
+_MISSING_URL_RESULT = Finding(
+    category="spec-quality",
+    severity="W",
+    tag="missing-url",
+    detail=_("URL field is missing."),
+    recommendation=_("Add a URL pointing to the project's homepage."),
+)
+_MISSING_SOURCE_RESULT = Finding(
+    category="spec-quality",
+    severity="W",
+    tag="missing-source",
+    detail=_("No Source tag found."),
+    recommendation=_("Add a Source0 tag with the upstream tarball URL."),
+)
+_MISSING_DESCRIPTION_RESULT = Finding(
+    category="spec-quality",
+    severity="E",
+    tag="missing-description",
+    detail=_("%%description section is missing."),
+    recommendation=_("Add a %%description section with a detailed package description."),
+)
+_MISSING_CHANGELOG_RESULT = Finding(
+    category="changelog",
+    severity="W",
+    tag="missing-changelog",
+    detail=_("%%changelog section is missing."),
+    recommendation=_("Add a %%changelog section with dated entries."),
+)
+_DEPRECATED_BUILDROOT_RESULT = Finding(
+    category="spec-quality",
+    severity="I",
+    tag="deprecated-buildroot",
+    detail=_("BuildRoot tag is deprecated in modern RPM."),
+    recommendation=_("Remove the BuildRoot tag; RPM sets it automatically."),
+)
+_DEPRECATED_CLEAN_RESULT = Finding(
+    category="spec-quality",
+    severity="I",
+    tag="deprecated-clean-section",
+    detail=_("%%clean section is deprecated in modern RPM."),
+    recommendation=_("Remove the %%clean section; rpmbuild handles cleanup automatically."),
+)
+_MISSING_URL_IN_RPM_RESULT = Finding(
+    category="spec-quality",
+    severity="W",
+    tag="missing-url-in-rpm",
+    detail=_("RPM package has no URL set."),
+    recommendation=_("Add a URL tag to the spec file."),
+)
+_RPM_NOT_INSTALLED_RESULT = Finding(
+    category="general",
+    severity="E",
+    tag="rpm-not-installed",
+    detail=_("rpm command not found."),
+    recommendation=_("Install the rpm package to analyze RPM files."),
+)
+_UNKNOWN_FILE_TYPE_RESULT = Finding(
+    category="general",
+    severity="E",
+    tag="unknown-file-type",
+    detail=_("File is not a .rpm or .spec file."),
+    recommendation=_("Open a .rpm package or .spec file."),
+)
+
+
+def _kill_process_group(pid):
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
 def _run_rpmlint(path):
     """Run rpmlint on an RPM file or spec file."""
     results = []
     try:
-        r = subprocess.run(
+        # Parse output as rpmlint produces it instead of buffering it all.
+        # rpmlint runs in its own process group so that a timeout also kills
+        # any children still holding the output pipe open.
+        with subprocess.Popen(
             ["rpmlint", path],
-            capture_output=True, text=True, timeout=120
-        )
-        for line in (r.stdout + r.stderr).splitlines():
-            # rpmlint output: "package: severity: tag detail"
-            m = re.match(r'^(.+?):\s*(\w):\s*(\S+)\s*(.*)', line)
-            if m:
-                results.append({
-                    "category": "rpmlint",
-                    "severity": m.group(2),
-                    "package": m.group(1).strip(),
-                    "tag": m.group(3),
-                    "detail": m.group(4),
-                    "recommendation": "",
-                })
-            elif line.strip() and not line.startswith(('---', ' ', 'rpmlint:')):
-                # Try simpler format: "tag: detail"
-                m2 = re.match(r'^(\S+):\s*(.*)', line)
-                if m2:
-                    results.append({
-                        "category": "rpmlint",
-                        "severity": "W",
-                        "package": "",
-                        "tag": m2.group(1),
-                        "detail": m2.group(2),
-                        "recommendation": "",
-                    })
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+            text=True, errors="replace", start_new_session=True,
+        ) as p:
+            timer = threading.Timer(_RPMLINT_TIMEOUT, _kill_process_group, (p.pid,))
+            timer.start()
+            try:
+                for line in p.stdout:
+                    m = _RPMLINT_FULL_RE.match(line)
+                    if m:
+                        _emit(
+                            results, "rpmlint", m.group(2), m.group(3), m.group(4),
+                            package=m.group(1).strip(),
+                        )
+                    elif line.strip() and not line.startswith(('---', ' ', 'rpmlint:')):
+                        # Try simpler format: "tag: detail"
+                        m2 = _RPMLINT_SIMPLE_RE.match(line)
+                        if m2:
+                            _emit(results, "rpmlint", "W", m2.group(1), m2.group(2))
+                p.wait()
+            finally:
+                # The timer also bounds the wait; if parsing failed, stop
+                # rpmlint instead of waiting for it to exit
+                if p.returncode is None:
+                    _kill_process_group(p.pid)
+                timer.cancel()
+        if p.returncode == -signal.SIGKILL:
+            raise subprocess.TimeoutExpired(p.args, _RPMLINT_TIMEOUT)
     except FileNotFoundError:
-        results.append({
-            "category": "rpmlint",
-            "severity": "E",
-            "tag": "rpmlint-not-installed",
-            "detail": _("rpmlint is not installed."),
-            "package": "",
-            "recommendation": _("Install with: sudo dnf install rpmlint"),
-        })
+        results = [_RPMLINT_NOT_INSTALLED_RESULT]
     except Exception as e:
-        results.append({
-            "category": "rpmlint",
-            "severity": "E",
-            "tag": "rpmlint-error",
-            "detail": str(e),
-            "package": "",
-            "recommendation": "",
-        })
+        # Partial output of a failed run is not reported
+        results = []
+        _emit(results, "rpmlint", "E", "rpmlint-error", str(e))
     return results
 
 
+_SPDX_IDENTIFIERS = frozenset({
+    "MIT", "Apache-2.0", "GPL-2.0-only", "GPL-2.0-or-later",
+    "GPL-3.0-only", "GPL-3.0-or-later", "LGPL-2.1-only",
+    "LGPL-2.1-or-later", "LGPL-3.0-only", "LGPL-3.0-or-later",
+    "BSD-2-Clause", "BSD-3-Clause", "MPL-2.0", "ISC", "Zlib",
+    "Unlicense", "CC0-1.0", "AGPL-3.0-only", "AGPL-3.0-or-later",
+    "Artistic-2.0", "BSL-1.0", "CC-BY-4.0", "CC-BY-SA-4.0",
+    "EPL-2.0", "EUPL-1.2", "WTFPL", "0BSD",
+})
+_OLD_FEDORA_LICENSES = frozenset({
+    "GPLv2", "GPLv2+", "GPLv3", "GPLv3+", "LGPLv2", "LGPLv2+",
+    "LGPLv3", "LGPLv3+", "ASL 2.0", "BSD", "MIT",
+})
+# Old Fedora names that are not also valid SPDX identifiers (e.g. not "MIT")
+_OLD_ONLY_LICENSES = _OLD_FEDORA_LICENSES - _SPDX_IDENTIFIERS
+_KNOWN_LICENSES = _SPDX_IDENTIFIERS | _OLD_FEDORA_LICENSES
+
+
+def _check_name_tag(name_val, results):
+    """Check the value of the Name tag."""
+    if name_val != name_val.lower():
+        _emit(
+            results, "naming", "W", "uppercase-package-name",
+            _("Package name '%s' contains uppercase letters.") % name_val,
+            package=name_val,
+            recommendation=_("Fedora guidelines recommend lowercase package names."),
+        )
+    if " " in name_val:
+        _emit(
+            results, "naming", "E", "space-in-package-name",
+            _("Package name contains spaces."),
+            package=name_val,
+            recommendation=_("Remove spaces from the package name."),
+        )
+
+
+def _check_release_tag(release_val, results):
+    """Check the value of the Release tag."""
+    if "%{?dist}" not in release_val:
+        results.append(_MISSING_DIST_TAG_RESULT)
+
+
+def _check_summary_tag(summary_val, results):
+    """Check the value of the Summary tag."""
+    if summary_val.endswith("."):
+        results.append(_SUMMARY_ENDS_WITH_DOT_RESULT)
+    if len(summary_val) > 80:
+        results.append(_SUMMARY_TOO_LONG_RESULT)
+
+
+_SCRIPTLET_SECTIONS = frozenset({
+    "%pre", "%post", "%preun", "%postun", "%pretrans", "%posttrans",
+})
+
+
+# Spec header tags we track, keyed by lowercased tag name.  Tags mapped to
+# a handler also get their value checked.
+_HEADER_HANDLERS = {
+    "name": _check_name_tag,
+    "version": None,
+    "release": _check_release_tag,
+    "summary": _check_summary_tag,
+    "license": None,
+    "url": None,
+    "buildroot": None,
+}
+
+
 def _check_spec_file(spec_path):
     """Check a .spec file against Fedora packaging guidelines."""
     results = []
-    try:
-        with open(spec_path) as f:
-            content = f.read()
-            lines = content.splitlines()
-    except Exception as e:
-        results.append({
-            "category": "general",
-            "severity": "E",
-            "tag": "spec-read-error",
-            "detail": str(e),
-            "package": "",
-            "recommendation": "",
-        })
-        return results
-
-    has_name = False
-    has_version = False
-    has_release = False
-    has_summary = False
-    has_license = False
-    has_url = False
+    headers = {}
     has_source = False
     has_description = False
     has_changelog = False
-    has_buildroot = False
     has_clean = False
-    license_value = ""
-
-    for line in lines:
-        stripped = line.strip()
-        lower = stripped.lower()
-        if lower.startswith("name:"):
-            has_name = True
-            name_val = stripped.split(":", 1)[1].strip()
-            # Naming check
-            if name_val != name_val.lower():
-                results.append({
-                    "category": "naming",
-                    "severity": "W",
-                    "tag": "uppercase-package-name",
-                    "detail": _("Package name '%s' contains uppercase letters.") % name_val,
-                    "package": name_val,
-                    "recommendation": _("Fedora guidelines recommend lowercase package names."),
-                })
-            if " " in name_val:
-                results.append({
-                    "category": "naming",
-                    "severity": "E",
-                    "tag": "space-in-package-name",
-                    "detail": _("Package name contains spaces."),
-                    "package": name_val,
-                    "recommendation": _("Remove spaces from the package name."),
-                })
-        elif lower.startswith("version:"):
-            has_version = True
-        elif lower.startswith("release:"):
-            has_release = True
-            release_val = stripped.split(":", 1)[1].strip()
-            if "%{?dist}" not in release_val:
-                results.append({
-                    "category": "spec-quality",
-                    "severity": "W",
-                    "tag": "missing-dist-tag",
-                    "detail": _("Release field does not contain %%{?dist}."),
-                    "package": "",
-                    "recommendation": _("Add %%{?dist} to the Release tag for proper distribution tagging."),
-                })
-        elif lower.startswith("summary:"):
-            has_summary = True
-            summary_val = stripped.split(":", 1)[1].strip()
-            if summary_val.endswith("."):
-                results.append({
-                    "category": "spec-quality",
-                    "severity": "W",
-                    "tag": "summary-ends-with-dot",
-                    "detail": _("Summary should not end with a period."),
-                    "package": "",
-                    "recommendation": _("Remove the trailing period from the Summary."),
-                })
-            if len(summary_val) > 80:
-                results.append({
-                    "category": "spec-quality",
-                    "severity": "W",
-                    "tag": "summary-too-long",
-                    "detail": _("Summary exceeds 80 characters."),
-                    "package": "",
-                    "recommendation": _("Keep the Summary concise (under 80 characters)."),
-                })
-        elif lower.startswith("license:"):
-            has_license = True
-            license_value = stripped.split(":", 1)[1].strip()
-        elif lower.startswith("url:"):
-            has_url = True
-        elif lower.startswith("source") and ":" in lower:
-            has_source = True
-        elif lower.startswith("buildroot:"):
-            has_buildroot = True
-        elif stripped == "%description":
-            has_description = True
-        elif stripped == "%changelog":
-            has_changelog = True
-        elif stripped == "%clean":
-            has_clean = True
+
+    # Per-line findings are collected separately so they are reported
+    # after the header-level checks.
+    macro_results = []
+    scriptlet_results = []
+    changelog_results = []
+    in_scriptlet = False
+    in_changelog = False
+
+    try:
+        # Undecodable bytes are replaced so the rest of the file is still checked
+        with open(spec_path, errors="replace") as spec_file:
+            for i, line in enumerate(spec_file, 1):
+                stripped = line.strip()
+
+                # Header fields and section markers
+                colon = stripped.find(":")
+                if colon > 0:
+                    # Only the (short) tag is lowercased, never the whole line
+                    tag = stripped[:colon].lower()
+                    if tag in _HEADER_HANDLERS:
+                        value = stripped[colon + 1:].strip()
+                        headers[tag] = value
+                        handler = _HEADER_HANDLERS[tag]
+                        if handler:
+                            handler(value, results)
+                    elif tag.startswith("source"):
+                        has_source = True
+                elif stripped == "%description":
+                    has_description = True
+                elif stripped == "%changelog":
+                    has_changelog = True
+                    in_changelog = True
+                elif stripped == "%clean":
+                    has_clean = True
+
+                # Hardcoded paths instead of macros; comments and blank lines are skipped
+                if stripped and stripped[0] != "#":
+                    is_source = stripped.startswith("Source")
+                    if "/usr/lib/" in stripped and "%{_libdir}" not in stripped:
+                        _emit(
+                            macro_results, "macros", "W", "hardcoded-library-path",
+                            _("Line %d: Hardcoded /usr/lib/ instead of %%{_libdir}.") % i,
+                            recommendation=_("Use %%{_libdir} macro instead of hardcoded library path."),
+                        )
+                    if "/usr/bin/" in stripped and "%{_bindir}" not in stripped and not is_source:
+                        _emit(
+                            macro_results, "macros", "W", "hardcoded-bindir",
+                            _("Line %d: Hardcoded /usr/bin/ instead of %%{_bindir}.") % i,
+                            recommendation=_("Use %%{_bindir} macro instead of hardcoded path."),
+                        )
+                    if "/usr/share/" in stripped and "%{_datadir}" not in stripped and not is_source:
+                        _emit(
+                            macro_results, "macros", "I", "hardcoded-datadir",
+                            _("Line %d: Hardcoded /usr/share/ instead of %%{_datadir}.") % i,
+                            recommendation=_("Use %%{_datadir} macro for portability."),
+                        )
+                    if "/etc/" in stripped and "%{_sysconfdir}" not in stripped:
+                        _emit(
+                            macro_results, "macros", "I", "hardcoded-sysconfdir",
+                            _("Line %d: Hardcoded /etc/ instead of %%{_sysconfdir}.") % i,
+                            recommendation=_("Use %%{_sysconfdir} macro for portability."),
+                        )
+
+                # Scriptlet sections: any other %section ends the scriptlet
+                if stripped in _SCRIPTLET_SECTIONS:
+                    in_scriptlet = True
+                elif stripped[:1] == "%" and stripped[1:2] != "{":
+                    in_scriptlet = False
+                elif in_scriptlet:
+                    if "rm -rf /" in stripped or "rm -rf $RPM_BUILD_ROOT" in stripped:
+                        _emit(
+                            scriptlet_results, "scriptlets", "E", "dangerous-rm-in-scriptlet",
+                            _("Line %d: Dangerous rm -rf in scriptlet.") % i,
+                            recommendation=_("Avoid destructive rm commands in scriptlets."),
+                        )
+                    if stripped.startswith("exit"):
+                        _emit(
+                            scriptlet_results, "scriptlets", "W", "exit-in-scriptlet",
+                            _("Line %d: 'exit' in scriptlet may cause transaction failure.") % i,
+                            recommendation=_("Use 'exit 0' or remove exit calls; scriptlet failures can block RPM transactions."),
+                        )
+
+                # Changelog format check
+                if in_changelog and line.startswith("*"):
+                    if not _CHANGELOG_RE.match(line):
+                        _emit(
+                            changelog_results, "changelog", "W", "malformed-changelog-entry",
+                            _("Line %d: Changelog entry does not follow standard format.") % i,
+                            recommendation=_("Use format: * Day Mon DD YYYY Name <email> - version-release"),
+                        )
+    except OSError as e:
+        # Findings from a partly read file are not reported
+        results = []
+        _emit(results, "general", "E", "spec-read-error", str(e))
+        return results
 
     # Check required fields
-    required = [
-        ("name", has_name), ("version", has_version), ("release", has_release),
-        ("summary", has_summary), ("license", has_license),
-    ]
-    for field, present in required:
-        if not present:
-            results.append({
-                "category": "spec-quality",
-                "severity": "E",
-                "tag": f"missing-{field}",
-                "detail": _("Required field '%s' is missing from spec file.") % field.capitalize(),
-                "package": "",
-                "recommendation": _("Add the %s tag to the spec file header.") % field.capitalize(),
-            })
-
-    if not has_url:
-        results.append({
-            "category": "spec-quality",
-            "severity": "W",
-            "tag": "missing-url",
-            "detail": _("URL field is missing."),
-            "package": "",
-            "recommendation": _("Add a URL pointing to the project's homepage."),
-        })
+    for field in ("name", "version", "release", "summary", "license"):
+        if field not in headers:
+            _emit(
+                results, "spec-quality", "E", f"missing-{field}",
+                _("Required field '%s' is missing from spec file.") % field.capitalize(),
+                recommendation=_("Add the %s tag to the spec file header.") % field.capitalize(),
+            )
+
+    if "url" not in headers:
+        results.append(_MISSING_URL_RESULT)
 
     if not has_source:
-        results.append({
-            "category": "spec-quality",
-            "severity": "W",
-            "tag": "missing-source",
-            "detail": _("No Source tag found."),
-            "package": "",
-            "recommendation": _("Add a Source0 tag with the upstream tarball URL."),
-        })
+        results.append(_MISSING_SOURCE_RESULT)
 
     if not has_description:
-        results.append({
-            "category": "spec-quality",
-            "severity": "E",
-            "tag": "missing-description",
-            "detail": _("%%description section is missing."),
-            "package": "",
-            "recommendation": _("Add a %%description section with a detailed package description."),
-        })
+        results.append(_MISSING_DESCRIPTION_RESULT)
 
     if not has_changelog:
-        results.append({
-            "category": "changelog",
-            "severity": "W",
-            "tag": "missing-changelog",
-            "detail": _("%%changelog section is missing."),
-            "package": "",
-            "recommendation": _("Add a %%changelog section with dated entries."),
-        })
+        results.append(_MISSING_CHANGELOG_RESULT)
 
     # Deprecated features
-    if has_buildroot:
-        results.append({
-            "category": "spec-quality",
-            "severity": "I",
-            "tag": "deprecated-buildroot",
-            "detail": _("BuildRoot tag is deprecated in modern RPM."),
-            "package": "",
-            "recommendation": _("Remove the BuildRoot tag; RPM sets it automatically."),
-        })
+    if "buildroot" in headers:
+        results.append(_DEPRECATED_BUILDROOT_RESULT)
 
     if has_clean:
-        results.append({
-            "category": "spec-quality",
-            "severity": "I",
-            "tag": "deprecated-clean-section",
-            "detail": _("%%clean section is deprecated in modern RPM."),
-            "package": "",
-            "recommendation": _("Remove the %%clean section; rpmbuild handles cleanup automatically."),
-        })
+        results.append(_DEPRECATED_CLEAN_RESULT)
 
     # License check (SPDX)
+    license_value = headers.get("license", "")
     if license_value:
-        spdx_identifiers = {
-            "MIT", "Apache-2.0", "GPL-2.0-only", "GPL-2.0-or-later",
-            "GPL-3.0-only", "GPL-3.0-or-later", "LGPL-2.1-only",
-            "LGPL-2.1-or-later", "LGPL-3.0-only", "LGPL-3.0-or-later",
-            "BSD-2-Clause", "BSD-3-Clause", "MPL-2.0", "ISC", "Zlib",
-            "Unlicense", "CC0-1.0", "AGPL-3.0-only", "AGPL-3.0-or-later",
-            "Artistic-2.0", "BSL-1.0", "CC-BY-4.0", "CC-BY-SA-4.0",
-            "EPL-2.0", "EUPL-1.2", "WTFPL", "0BSD",
-        }
-        old_fedora_licenses = {
-            "GPLv2", "GPLv2+", "GPLv3", "GPLv3+", "LGPLv2", "LGPLv2+",
-            "LGPLv3", "LGPLv3+", "ASL 2.0", "BSD", "MIT",
-        }
         # Check each license in expression (handle AND/OR)
-        license_parts = re.split(r'\s+(?:AND|OR|and|or)\s+', license_value)
+        license_parts = _LICENSE_SPLIT_RE.split(license_value)
         for part in license_parts:
             part = part.strip().strip("()")
-            if part in old_fedora_licenses and part not in spdx_identifiers:
-                results.append({
-                    "category": "licensing",
-                    "severity": "W",
-                    "tag": "old-license-identifier",
-                    "detail": _("License '%s' uses old Fedora format, not SPDX.") % part,
-                    "package": "",
-                    "recommendation": _("Fedora 40+ requires SPDX license identifiers. Convert to SPDX format."),
-                })
-            elif part not in spdx_identifiers and part not in old_fedora_licenses:
-                results.append({
-                    "category": "licensing",
-                    "severity": "I",
-                    "tag": "unknown-license-identifier",
-                    "detail": _("License identifier '%s' is not a recognized SPDX identifier.") % part,
-                    "package": "",
-                    "recommendation": _("Check https://spdx.org/licenses/ for valid SPDX identifiers."),
-                })
-
-    # Check for common macro issues
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-        # Hardcoded paths instead of macros
-        if "/usr/lib/" in stripped and "%{_libdir}" not in stripped and not stripped.startswith("#"):
-            results.append({
-                "category": "macros",
-                "severity": "W",
-                "tag": "hardcoded-library-path",
-                "detail": _("Line %d: Hardcoded /usr/lib/ instead of %%{_libdir}.") % i,
-                "package": "",
-                "recommendation": _("Use %%{_libdir} macro instead of hardcoded library path."),
-            })
-        if "/usr/bin/" in stripped and "%{_bindir}" not in stripped and not stripped.startswith("#") and not stripped.startswith("Source"):
-            results.append({
-                "category": "macros",
-                "severity": "W",
-                "tag": "hardcoded-bindir",
-                "detail": _("Line %d: Hardcoded /usr/bin/ instead of %%{_bindir}.") % i,
-                "package": "",
-                "recommendation": _("Use %%{_bindir} macro instead of hardcoded path."),
-            })
-        if "/usr/share/" in stripped and "%{_datadir}" not in stripped and not stripped.startswith("#") and not stripped.startswith("Source"):
-            results.append({
-                "category": "macros",
-                "severity": "I",
-                "tag": "hardcoded-datadir",
-                "detail": _("Line %d: Hardcoded /usr/share/ instead of %%{_datadir}.") % i,
-                "package": "",
-                "recommendation": _("Use %%{_datadir} macro for portability."),
-            })
-        if "/etc/" in stripped and "%{_sysconfdir}" not in stripped and not stripped.startswith("#"):
-            results.append({
-                "category": "macros",
-                "severity": "I",
-                "tag": "hardcoded-sysconfdir",
-                "detail": _("Line %d: Hardcoded /etc/ instead of %%{_sysconfdir}.") % i,
-                "package": "",
-                "recommendation": _("Use %%{_sysconfdir} macro for portability."),
-            })
-
-    # Check scriptlets for common issues
-    in_scriptlet = False
-    for i, line in enumerate(lines, 1):
-        stripped = line.strip()
-        if stripped in ("%pre", "%post", "%preun", "%postun", "%pretrans", "%posttrans"):
-            in_scriptlet = True
-            continue
-        if stripped.startswith("%") and not stripped.startswith("%{"):
-            in_scriptlet = False
-        if in_scriptlet:
-            if "rm -rf /" in stripped or "rm -rf $RPM_BUILD_ROOT" in stripped:
-                results.append({
-                    "category": "scriptlets",
-                    "severity": "E",
-                    "tag": "dangerous-rm-in-scriptlet",
-                    "detail": _("Line %d: Dangerous rm -rf in scriptlet.") % i,
-                    "package": "",
-                    "recommendation": _("Avoid destructive rm commands in scriptlets."),
-                })
-            if stripped.startswith("exit"):
-                results.append({
-                    "category": "scriptlets",
-                    "severity": "W",
-                    "tag": "exit-in-scriptlet",
-                    "detail": _("Line %d: 'exit' in scriptlet may cause transaction failure.") % i,
-                    "package": "",
-                    "recommendation": _("Use 'exit 0' or remove exit calls; scriptlet failures can block RPM transactions."),
-                })
-
-    # Changelog format check
-    in_changelog = False
-    for i, line in enumerate(lines, 1):
-        if line.strip() == "%changelog":
-            in_changelog = True
-            continue
-        if in_changelog:
-            if line.startswith("*"):
-                # Expected: * Day Mon DD YYYY Name <email> - version
-                m = re.match(r'^\*\s+\w+\s+\w+\s+\d+\s+\d{4}\s+.+\s+<.+@.+>', line)
-                if not m:
-                    results.append({
-                        "category": "changelog",
-                        "severity": "W",
-                        "tag": "malformed-changelog-entry",
-                        "detail": _("Line %d: Changelog entry does not follow standard format.") % i,
-                        "package": "",
-                        "recommendation": _("Use format: * Day Mon DD YYYY Name <email> - version-release"),
-                    })
+            if part in _OLD_ONLY_LICENSES:
+                _emit(
+                    results, "licensing", "W", "old-license-identifier",
+                    _("License '%s' uses old Fedora format, not SPDX.") % part,
+                    recommendation=_("Fedora 40+ requires SPDX license identifiers. Convert to SPDX format."),
+                )
+            elif part not in _KNOWN_LICENSES:
+                _emit(
+                    results, "licensing", "I", "unknown-license-identifier",
+                    _("License identifier '%s' is not a recognized SPDX identifier.") % part,
+                    recommendation=_("Check https://spdx.org/licenses/ for valid SPDX identifiers."),
+                )
+
+    results.extend(macro_results)
+    results.extend(scriptlet_results)
+    results.extend(changelog_results)
 
     return results
 
 
+def _run_future(future, fn, *args):
+    """Run fn(*args) and store its outcome in future unless it was cancelled."""
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        result = fn(*args)
+    except BaseException as e:
+        future.set_exception(e)
+    else:
+        future.set_result(result)
+
+
+def _submit_daemon(fn, *args):
+    """Run fn(*args) in a daemon thread and return a Future for the result.
+
+    Unlike ThreadPoolExecutor workers, daemon threads are not joined at
+    interpreter exit, so closing the window mid-check quits right away.
+    """
+    future = Future()
+    threading.Thread(
+        target=_run_future, args=(future, fn, *args), daemon=True
+    ).start()
+    return future
+
+
+class _RPMQueryError(Exception):
+    """Raised when an RPM package header cannot be read."""
+
+
+def _read_rpm_header(rpm_path):
+    """Return (url, files, requires) read with the rpm Python bindings."""
+    ts = rpm.TransactionSet()
+    ts.setVSFlags(rpm._RPMVSF_NOSIGNATURES)
+    try:
+        fd = os.open(rpm_path, os.O_RDONLY)
+        try:
+            hdr = ts.hdrFromFdno(fd)
+        finally:
+            os.close(fd)
+    except (OSError, rpm.error) as e:
+        raise _RPMQueryError(str(e)) from e
+    return (
+        hdr[rpm.RPMTAG_URL] or "",
+        list(hdr[rpm.RPMTAG_FILENAMES]),
+        list(hdr[rpm.RPMTAG_REQUIRENAME]),
+    )
+
+
+def _rpm_query(flag, rpm_path):
+    """Run a single rpm query against a package file."""
+    return subprocess.run(
+        ["rpm", flag, rpm_path],
+        capture_output=True, text=True, timeout=30
+    )
+
+
+def _query_rpm_file(rpm_path):
+    """Return (url, files, requires) parsed from the rpm command output.
+
+    rpm leaves out the URL line when the tag is unset; url is then "",
+    as with the Python bindings.
+    """
+    # Query info, file list and dependencies concurrently
+    futures = [
+        _submit_daemon(_rpm_query, flag, rpm_path)
+        for flag in ("-qpi", "-qpl", "-qpR")
+    ]
+    r, r2, r3 = [fut.result() for fut in futures]
+
+    if r.returncode != 0:
+        raise _RPMQueryError(r.stderr.strip())
+
+    m = _RPM_INFO_URL_RE.search(r.stdout)
+    url_val = m.group(1).strip() if m else ""
+
+    files = r2.stdout.splitlines() if r2.returncode == 0 else []
+    deps = r3.stdout.splitlines() if r3.returncode == 0 else []
+    return url_val, files, deps
+
+
+_TMP_PREFIXES = ("/tmp/", "/var/tmp/")
+# File dependencies that are fine outside /usr
+_FILE_DEP_ALLOWLIST = frozenset({"/bin/sh", "/bin/bash", "/sbin/ldconfig"})
+
+
 def _check_rpm_file(rpm_path):
     """Check an RPM binary file."""
     results = []
     try:
-        # Extract info
-        r = subprocess.run(
-            ["rpm", "-qpi", rpm_path],
-            capture_output=True, text=True, timeout=30
-        )
-        if r.returncode != 0:
-            results.append({
-                "category": "general",
-                "severity": "E",
-                "tag": "rpm-query-failed",
-                "detail": r.stderr.strip() or _("Failed to query RPM package."),
-                "package": "",
-                "recommendation": _("Ensure the file is a valid RPM package."),
-            })
-            return results
+        if rpm is not None:
+            url_val, files, deps = _read_rpm_header(rpm_path)
+        else:
+            url_val, files, deps = _query_rpm_file(rpm_path)
 
-        info = r.stdout
         # Check for missing URL
-        for line in info.splitlines():
-            if line.startswith("URL"):
-                url_val = line.split(":", 1)[1].strip() if ":" in line else ""
-                if not url_val or url_val == "(none)":
-                    results.append({
-                        "category": "spec-quality",
-                        "severity": "W",
-                        "tag": "missing-url-in-rpm",
-                        "detail": _("RPM package has no URL set."),
-                        "package": "",
-                        "recommendation": _("Add a URL tag to the spec file."),
-                    })
+        if not url_val or url_val == "(none)":
+            results.append(_MISSING_URL_IN_RPM_RESULT)
 
         # Check file list
-        r2 = subprocess.run(
-            ["rpm", "-qpl", rpm_path],
-            capture_output=True, text=True, timeout=30
-        )
-        if r2.returncode == 0:
-            files = r2.stdout.splitlines()
-            for fp in files:
-                if fp.startswith("/usr/local/"):
-                    results.append({
-                        "category": "file-placement",
-                        "severity": "E",
-                        "tag": "file-in-usr-local",
-                        "detail": _("File installed in /usr/local/: %s") % fp,
-                        "package": "",
-                        "recommendation": _("RPM packages must not install files under /usr/local/."),
-                    })
-                if fp == "/usr/lib/.build-id" or "/.build-id/" in fp:
-                    continue  # Normal
-                if fp.startswith("/tmp/") or fp.startswith("/var/tmp/"):
-                    results.append({
-                        "category": "file-placement",
-                        "severity": "E",
-                        "tag": "file-in-tmp",
-                        "detail": _("File installed in temporary directory: %s") % fp,
-                        "package": "",
-                        "recommendation": _("Do not install files under /tmp/ or /var/tmp/."),
-                    })
+        for fp in files:
+            if fp.startswith("/usr/local/"):
+                _emit(
+                    results, "file-placement", "E", "file-in-usr-local",
+                    _("File installed in /usr/local/: %s") % fp,
+                    recommendation=_("RPM packages must not install files under /usr/local/."),
+                )
+            if fp == "/usr/lib/.build-id" or "/.build-id/" in fp:
+                continue  # Normal
+            if fp.startswith(_TMP_PREFIXES):
+                _emit(
+                    results, "file-placement", "E", "file-in-tmp",
+                    _("File installed in temporary directory: %s") % fp,
+                    recommendation=_("Do not install files under /tmp/ or /var/tmp/."),
+                )
 
         # Check dependencies
-        r3 = subprocess.run(
-            ["rpm", "-qpR", rpm_path],
-            capture_output=True, text=True, timeout=30
+        for dep in deps:
+            dep = dep.strip()
+            if dep.startswith("/") and not dep.startswith("/usr/"):
+                if dep not in _FILE_DEP_ALLOWLIST:
+                    _emit(
+                        results, "dependencies", "I", "file-dependency",
+                        _("File-based dependency: %s") % dep,
+                        recommendation=_("Consider using package-based dependencies instead of file paths where possible."),
+                    )
+
+    except _RPMQueryError as e:
+        _emit(
+            results, "general", "E", "rpm-query-failed",
+            str(e) or _("Failed to query RPM package."),
+            recommendation=_("Ensure the file is a valid RPM package."),
         )
-        if r3.returncode == 0:
-            deps = r3.stdout.splitlines()
-            for dep in deps:
-                dep = dep.strip()
-                if dep.startswith("/") and not dep.startswith("/usr/"):
-                    if dep not in ("/bin/sh", "/bin/bash", "/sbin/ldconfig"):
-                        results.append({
-                            "category": "dependencies",
-                            "severity": "I",
-                            "tag": "file-dependency",
-                            "detail": _("File-based dependency: %s") % dep,
-                            "package": "",
-                            "recommendation": _("Consider using package-based dependencies instead of file paths where possible."),
-                        })
-
     except FileNotFoundError:
-        results.append({
-            "category": "general",
-            "severity": "E",
-            "tag": "rpm-not-installed",
-            "detail": _("rpm command not found."),
-            "package": "",
-            "recommendation": _("Install the rpm package to analyze RPM files."),
-        })
+        results.append(_RPM_NOT_INSTALLED_RESULT)
     except Exception as e:
-        results.append({
-            "category": "general",
-            "severity": "E",
-            "tag": "rpm-error",
-            "detail": str(e),
-            "package": "",
-            "recommendation": "",
-        })
+        _emit(results, "general", "E", "rpm-error", str(e))
 
     return results
 
 
-def check_package(path, run_rpmlint=True):
-    """Run all checks on a package or spec file."""
-    results = []
+# Errors that mean the file could not be analysed at all; rpmlint would only
+# fail on it as well.
+_FATAL_TAGS = frozenset({"spec-read-error", "rpm-query-failed"})
+# Results containing these are not cached: they come from the environment
+# (or, for unreadable files, from permissions that do not touch the mtime)
+# rather than from the package itself.
+_UNCACHEABLE_TAGS = _FATAL_TAGS | {
+    "rpm-not-installed", "rpm-error", "rpmlint-not-installed", "rpmlint-error",
+}
+# Cache entries unused for this long are removed, and at most this many
+# entries are kept
+_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+_CACHE_MAX_ENTRIES = 500
+
 
+def _get_rpmlint_version():
+    """Return the installed rpmlint version, or an empty string.
+
+    The version is queried again whenever the rpmlint executable is
+    installed, removed or replaced.
+    """
+    exe = shutil.which("rpmlint")
+    if exe is None:
+        return ""
+    try:
+        st = os.stat(exe)
+    except OSError:
+        return ""
+    return _query_rpmlint_version(exe, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _query_rpmlint_version(exe, _mtime_ns, _size):
+    try:
+        r = subprocess.run(
+            [exe, "--version"],
+            capture_output=True, text=True, timeout=30
+        )
+        return r.stdout.strip()
+    except Exception:
+        return ""
+
+
+def _cache_path(path, run_rpmlint):
+    """Return the result cache file for the current state of path, or None."""
+    from . import __version__
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    rpmlint_version = _get_rpmlint_version() if run_rpmlint else ""
+    # Findings are stored translated, so the message language is part of the key
+    lang = "|".join(
+        os.environ.get(var, "") for var in ("LANGUAGE", "LC_ALL", "LC_MESSAGES", "LANG")
+    )
+    key = hashlib.blake2b(
+        f"{__version__}|{os.path.abspath(path)}|{st.st_mtime_ns}|{st.st_size}|"
+        f"{run_rpmlint}|{rpmlint_version}|{lang}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def _load_cached_results(cache_file):
+    try:
+        with open(cache_file) as f:
+            results = [Finding(**r) for r in json.load(f)]
+    except (OSError, ValueError, TypeError):
+        return None
+    # Mark the entry as recently used for _prune_cache
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return results
+
+
+def _save_cached_results(cache_file, results):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump([r._asdict() for r in results], f)
+            os.replace(tmp, cache_file)
+        except OSError:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+    else:
+        _prune_cache()
+
+
+def _prune_cache():
+    """Remove stale cache entries and keep only the most recently used ones."""
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            entries = [
+                (e.stat().st_mtime, e.path) for e in it if e.name.endswith(".json")
+            ]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    cutoff = datetime.datetime.now().timestamp() - _CACHE_MAX_AGE
+    for i, (mtime, cache_file) in enumerate(entries):
+        if i >= _CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(cache_file)
+            except OSError:
+                pass
+
+
+def check_package(path, run_rpmlint=True, fast_fail=True):
+    """Run all checks on a package or spec file.
+
+    With fast_fail, rpmlint is skipped when our own checks already found
+    that the file cannot be read or queried.
+
+    Results are cached on disk, keyed by the file's path, mtime and size,
+    the installed rpmlint version and the message language, so re-opening
+    an unchanged file skips the analysis.
+    """
+    cache_file = _cache_path(path, run_rpmlint)
+    if cache_file:
+        results = _load_cached_results(cache_file)
+        if results is not None:
+            return results
+
+    results = _run_checks(path, run_rpmlint, fast_fail)
+
+    if cache_file and not any(r.tag in _UNCACHEABLE_TAGS for r in results):
+        _save_cached_results(cache_file, results)
+    return results
+
+
+_RPM_LEAD_MAGIC = b"\xed\xab\xee\xdb"
+
+
+def _detect_check(path):
+    """Return the check function for path, or None if it is not recognised.
+
+    RPM packages are identified by their lead magic, so packages without
+    an .rpm extension are still checked as packages.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.readline(4096)
+    except OSError:
+        head = b""
+    if head.startswith(_RPM_LEAD_MAGIC) or path.endswith(".rpm"):
+        return _check_rpm_file
     if path.endswith(".spec"):
-        results.extend(_check_spec_file(path))
-        if run_rpmlint:
+        return _check_spec_file
+    # Try as spec file if it looks like text
+    if b"\0" not in head and (b"Name:" in head or b"%" in head):
+        return _check_spec_file
+    return None
+
+
+def _run_checks(path, run_rpmlint, fast_fail):
+    """Dispatch path to the spec file or RPM checks."""
+    check = _detect_check(path)
+    if check is None:
+        return [_UNKNOWN_FILE_TYPE_RESULT]
+
+    # rpmlint picks the check mode from the file extension
+    if not (run_rpmlint and path.endswith((".spec", ".rpm"))):
+        return check(path)
+
+    if fast_fail:
+        # Our own checks are cheap next to rpmlint, so run them first and
+        # only start rpmlint if the file could actually be analysed
+        results = check(path)
+        if not any(r.severity == "E" and r.tag in _FATAL_TAGS for r in results):
             results.extend(_run_rpmlint(path))
-    elif path.endswith(".rpm"):
-        results.extend(_check_rpm_file(path))
-        if run_rpmlint:
-            results.extend(_run_rpmlint(path))
-    else:
-        # Try as spec file if it looks like text
-        try:
-            with open(path) as f:
-                first_line = f.readline()
-            if "Name:" in first_line or "%" in first_line:
-                results.extend(_check_spec_file(path))
-            else:
-                results.append({
-                    "category": "general",
-                    "severity": "E",
-                    "tag": "unknown-file-type",
-                    "detail": _("File is not a .rpm or .spec file."),
-                    "package": "",
-                    "recommendation": _("Open a .rpm package or .spec file."),
-                })
-        except Exception:
-            results.append({
-                "category": "general",
-                "severity": "E",
-                "tag": "unknown-file-type",
-                "detail": _("File is not a .rpm or .spec file."),
-                "package": "",
-                "recommendation": _("Open a .rpm package or .spec file."),
-            })
+        return results
 
+    # rpmlint is by far the slowest step; run it alongside our own checks
+    rpmlint_future = _submit_daemon(_run_rpmlint, path)
+    results = check(path)
+    results.extend(rpmlint_future.result())
     return results
 
 
 # ── GTK4/Adwaita UI ─────────────────────────────────────────────────
 
+# Result rows built per main loop iteration
+RESULT_ROWS_PER_CHUNK = 50
+
+
 class RPMPolicyCheckerWindow(Adw.ApplicationWindow):
     def __init__(self, app):
         super().__init__(
@@ -602,6 +839,15 @@ class RPMPolicyCheckerWindow(Adw.ApplicationWindow):
         )
         self.settings = _load_settings()
         self._results = []
+        # Only the most recently opened file matters, so checks run one at a
+        # time on a daemon worker and a newer request supersedes any pending
+        # or running one.
+        self._check_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._check_worker, daemon=True).start()
+        self._current_future = None
+        self._pending_future = None
+        self._drain_pending = False
+        self._build_source_id = 0
         self._accessibility = AccessibilityManager(self, app)
 
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL)
@@ -662,19 +908,15 @@ class RPMPolicyCheckerWindow(Adw.ApplicationWindow):
         self._spinner_page.set_vexpand(True)
 
         # Results view
-        scroll = Gtk.ScrolledWindow(vexpand=True)
-        self._results_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
-        self._results_box.set_margin_start(12)
-        self._results_box.set_margin_end(12)
-        self._results_box.set_margin_top(8)
-        self._results_box.set_margin_bottom(8)
-        scroll.set_child(self._results_box)
+        self._results_scroll = Gtk.ScrolledWindow(vexpand=True)
+        self._results_box = None
+        self._replace_results_box()
 
         self._stack = Gtk.Stack()
         self._stack.add_named(self._empty, "empty")
         self._stack.add_named(self._success, "success")
         self._stack.add_named(self._spinner_page, "spinner")
-        self._stack.add_named(scroll, "results")
+        self._stack.add_named(self._results_scroll, "results")
         self._stack.set_vexpand(True)
         main_box.append(self._stack)
 
@@ -785,103 +1027,194 @@ class RPMPolicyCheckerWindow(Adw.ApplicationWindow):
         self._status.set_text(_("Checking %s…") % os.path.basename(path))
         self._title_widget.set_subtitle(os.path.basename(path))
         self._stack.set_visible_child_name("spinner")
-        threading.Thread(target=self._do_check, args=(path,), daemon=True).start()
+        self._cancel_results_build()
+        if self._current_future is not None:
+            self._current_future.cancel()
+        future = Future()
+        future.add_done_callback(self._on_check_done)
+        self._current_future = future
+        # Drop a check that has not started yet; the worker is the only
+        # consumer, so the queue has room afterwards
+        try:
+            self._check_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._check_queue.put_nowait((future, path))
+
+    def _check_worker(self):
+        while True:
+            future, path = self._check_queue.get()
+            _run_future(future, check_package, path)
 
-    def _do_check(self, path):
-        results = check_package(path)
-        GLib.idle_add(self._show_results, results)
+    def _on_check_done(self, future):
+        # Called on the worker thread; keep only the newest finished check
+        # and queue at most one idle callback to deliver it
+        if future.cancelled():
+            return
+        self._pending_future = future
+        if not self._drain_pending:
+            self._drain_pending = True
+            # Building the result widgets is not urgent; run it below redraws
+            # and input handling so the window stays responsive meanwhile
+            GLib.idle_add(self._drain_results, priority=GLib.PRIORITY_LOW)
+
+    def _drain_results(self):
+        self._drain_pending = False
+        future, self._pending_future = self._pending_future, None
+        # Drop results of a check that was superseded while it was running
+        if future is not None and future is self._current_future:
+            self._show_results(future.result())
+        return False
 
     def _show_results(self, results):
-        global SEVERITY_NAMES
-        SEVERITY_NAMES = _get_severity_names()
         self._results = results
 
-        # Filter based on settings
+        # Filter based on settings, group by category and count in one pass
+        hidden = set()
         if not self.settings.get("show_pedantic", True):
-            results = [r for r in results if r["severity"] != "P"]
+            hidden.add("P")
         if not self.settings.get("show_info", True):
-            results = [r for r in results if r["severity"] != "I"]
-
-        # Clear results box
-        while True:
-            child = self._results_box.get_first_child()
-            if child is None:
-                break
-            self._results_box.remove(child)
-
-        if not results:
+            hidden.add("I")
+        grouped = {}
+        total = errors = warnings = 0
+        for r in results:
+            sev = r.severity
+            if sev in hidden:
+                continue
+            if sev == "E":
+                errors += 1
+            elif sev == "W":
+                warnings += 1
+            total += 1
+            grouped.setdefault(r.category, []).append(r)
+
+        self._cancel_results_build()
+        self._replace_results_box()
+
+        if not grouped:
             self._stack.set_visible_child_name("success")
             self._status.set_text(_("All checks passed!"))
             return
 
-        # Group by category
-        grouped = {}
-        for r in results:
-            cat = r.get("category", "general")
-            grouped.setdefault(cat, []).append(r)
+        # Rows are built in chunks from idle callbacks so the main loop keeps
+        # running; the spinner stays up until every row exists
+        self._stack.set_visible_child_name("spinner")
+        status = (
+            _("%(total)d issues: %(errors)d errors, %(warnings)d warnings")
+            % {"total": total, "errors": errors, "warnings": warnings}
+        )
+        groups = []
+        self._build_source_id = GLib.idle_add(
+            self._build_results_chunk,
+            self._build_result_rows(grouped, groups), groups, status,
+            priority=GLib.PRIORITY_LOW,
+        )
 
-        errors = sum(1 for r in results if r["severity"] == "E")
-        warnings = sum(1 for r in results if r["severity"] == "W")
+    def _cancel_results_build(self):
+        """Stop building the widgets of a previous result set."""
+        if self._build_source_id:
+            GLib.source_remove(self._build_source_id)
+            self._build_source_id = 0
+
+    def _replace_results_box(self):
+        """Swap in an empty results box; the old one goes with all its rows."""
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=12)
+        box.set_margin_start(12)
+        box.set_margin_end(12)
+        box.set_margin_top(8)
+        box.set_margin_bottom(8)
+        self._results_scroll.set_child(box)
+        self._results_box = box
+
+    def _build_results_chunk(self, rows, groups, status):
+        built = sum(1 for _row in itertools.islice(rows, RESULT_ROWS_PER_CHUNK))
+        if built == RESULT_ROWS_PER_CHUNK:
+            return True
+        self._build_source_id = 0
+
+        for group in groups:
+            self._results_box.append(group)
+
+        self._stack.set_visible_child_name("results")
+        self._status.set_text(status)
+        return False
+
+    def _build_result_rows(self, grouped, groups):
+        """Create the result widgets into groups, yielding after each row."""
+        # Per-severity (icon, label, badge css classes) so each row does one
+        # lookup and each badge gets its classes at construction
+        sev_names = _get_severity_names()
+        sev_table = {
+            key: (icon, sev_names.get(key, key), SEVERITY_CSS.get(key, ("caption",)))
+            for key, icon in SEVERITY_ICONS.items()
+        }
 
         for cat_key, cat_results in grouped.items():
-            cat_name = CATEGORIES.get(cat_key, cat_key.replace("-", " ").title())
+            if cat_key in CATEGORIES:
+                cat_name = _(CATEGORIES[cat_key])
+            else:
+                cat_name = cat_key.replace("-", " ").title()
 
             # Category group
             group = Adw.PreferencesGroup()
             group.set_title(cat_name)
-            group.set_description(
-                _("%(count)d issue(s)") % {"count": len(cat_results)}
-            )
+            count = len(cat_results)
+            group.set_description(ngettext("%d issue", "%d issues", count) % count)
+            groups.append(group)
 
             for r in cat_results:
-                icon = SEVERITY_ICONS.get(r["severity"], "❓")
-                sev = SEVERITY_NAMES.get(r["severity"], r["severity"])
+                icon, sev, badge_css = sev_table.get(
+                    r.severity, ("❓", r.severity, ("caption",))
+                )
 
                 row = Adw.ExpanderRow()
-                row.set_title(f"{icon} {r['tag']}")
-                row.set_subtitle(r.get("detail", ""))
-
-                badge = Gtk.Label(label=sev)
-                badge.add_css_class("caption")
-                if r["severity"] == "E":
-                    badge.add_css_class("error")
-                elif r["severity"] == "W":
-                    badge.add_css_class("warning")
+                row.set_title(f"{icon} {r.tag}")
+                row.set_subtitle(r.detail)
+
+                badge = Gtk.Label(label=sev, css_classes=badge_css)
                 row.add_suffix(badge)
 
-                # Recommendation sub-row
-                if r.get("recommendation"):
-                    rec_row = Adw.ActionRow()
-                    rec_row.set_title(_("💡 Recommendation"))
-                    rec_row.set_subtitle(r["recommendation"])
-                    rec_row.set_subtitle_lines(5)
-                    row.add_row(rec_row)
+                # Recommendation sub-row, built on first expand
+                if r.recommendation:
+                    row.recommendation = r.recommendation
+                    row.connect("notify::expanded", self._on_result_expanded)
 
                 group.add(row)
+                yield
 
-            self._results_box.append(group)
+    def _on_result_expanded(self, row, _pspec):
+        """Add the recommendation sub-row the first time a result is expanded."""
+        if not row.get_expanded():
+            return
+        row.disconnect_by_func(self._on_result_expanded)
 
-        self._stack.set_visible_child_name("results")
-        self._status.set_text(
-            _("%(total)d issues: %(errors)d errors, %(warnings)d warnings")
-            % {"total": len(results), "errors": errors, "warnings": warnings}
-        )
+        rec_row = Adw.ActionRow()
+        rec_row.set_title(_("💡 Recommendation"))
+        rec_row.set_subtitle(row.recommendation)
+        rec_row.set_subtitle_lines(5)
+        row.add_row(rec_row)
 
 
 class RPMPolicyCheckerApp(Adw.Application):
+    _ACTIONS = (
+        ("settings", "_on_settings"),
+        ("copy-debug", "_on_copy_debug"),
+        ("shortcuts", "_on_shortcuts"),
+        ("about", "_on_about"),
+        ("quit", "_on_quit"),
+    )
+
     def __init__(self):
         super().__init__(application_id=APP_ID, flags=Gio.ApplicationFlags.FLAGS_NONE)
         self.window = None
+        self._save_pending = 0
+        self._settings_dialog = None
+        self._shortcuts_window = None
+        self._about_dialog = None
 
-        for name, callback in [
-            ("settings", self._on_settings),
-            ("copy-debug", self._on_copy_debug),
-            ("shortcuts", self._on_shortcuts),
-            ("about", self._on_about),
-            ("quit", self._on_quit),
-        ]:
+        for name, method in self._ACTIONS:
             action = Gio.SimpleAction.new(name, None)
-            action.connect("activate", callback)
+            action.connect("activate", getattr(self, method))
             self.add_action(action)
 
         self.set_accels_for_action("app.quit", ["<Ctrl>q"])
@@ -892,9 +1225,22 @@ class RPMPolicyCheckerApp(Adw.Application):
             self.window = RPMPolicyCheckerWindow(self)
         self.window.present()
 
+    def do_shutdown(self):
+        # Write out a settings change still waiting for its timeout
+        if self._save_pending:
+            GLib.source_remove(self._save_pending)
+            self._flush_settings()
+        Adw.Application.do_shutdown(self)
+
     def _on_settings(self, *_args):
         if not self.window:
             return
+        # Built once; the switches keep the dialog in sync with the settings
+        if self._settings_dialog is None:
+            self._settings_dialog = self._build_settings_dialog()
+        self._settings_dialog.present(self.window)
+
+    def _build_settings_dialog(self):
         dialog = Adw.PreferencesDialog()
         dialog.set_title(_("Settings"))
 
@@ -924,26 +1270,38 @@ class RPMPolicyCheckerApp(Adw.Application):
         page.add(dist_group)
 
         dialog.add(page)
-        dialog.present(self.window)
+        return dialog
 
     def _on_pedantic_changed(self, row, *_args):
         self.window.settings["show_pedantic"] = row.get_active()
-        _save_settings(self.window.settings)
+        self._queue_settings_save()
 
     def _on_info_changed(self, row, *_args):
         self.window.settings["show_info"] = row.get_active()
+        self._queue_settings_save()
+
+    def _queue_settings_save(self):
+        """Save the settings once they have stopped changing for a moment."""
+        if self._save_pending:
+            GLib.source_remove(self._save_pending)
+        self._save_pending = GLib.timeout_add(500, self._flush_settings)
+
+    def _flush_settings(self):
+        self._save_pending = 0
         _save_settings(self.window.settings)
+        return False
 
     def _on_copy_debug(self, *_args):
         if not self.window:
             return
         from . import __version__
+        uname = os.uname()
         info = (
             f"RPM Policy Checker {__version__}\n"
             f"Python {sys.version}\n"
             f"GTK {Gtk.MAJOR_VERSION}.{Gtk.MINOR_VERSION}\n"
             f"Adw {Adw.MAJOR_VERSION}.{Adw.MINOR_VERSION}\n"
-            f"OS: {os.uname().sysname} {os.uname().release}\n"
+            f"OS: {uname.sysname} {uname.release}\n"
         )
         clipboard = Gdk.Display.get_default().get_clipboard()
         clipboard.set(info)
@@ -951,23 +1309,34 @@ class RPMPolicyCheckerApp(Adw.Application):
 
     def _on_shortcuts(self, *_args):
         if self.window:
-            dialog = Gtk.ShortcutsWindow(transient_for=self.window)
-            section = Gtk.ShortcutsSection(visible=True)
-            group = Gtk.ShortcutsGroup(title=_("General"), visible=True)
-            for accel, title in [
-                ("<Ctrl>q", _("Quit")),
-                ("<Ctrl>slash", _("Keyboard shortcuts")),
-            ]:
-                group.append(
-                    Gtk.ShortcutsShortcut(accelerator=accel, title=title, visible=True)
-                )
-            section.append(group)
-            dialog.append(section)
-            dialog.present()
+            if self._shortcuts_window is None:
+                self._shortcuts_window = self._build_shortcuts_window()
+            self._shortcuts_window.present()
+
+    def _build_shortcuts_window(self):
+        # Hidden rather than destroyed on close so it can be shown again
+        dialog = Gtk.ShortcutsWindow(transient_for=self.window, hide_on_close=True)
+        section = Gtk.ShortcutsSection(visible=True)
+        group = Gtk.ShortcutsGroup(title=_("General"), visible=True)
+        for accel, title in [
+            ("<Ctrl>q", _("Quit")),
+            ("<Ctrl>slash", _("Keyboard shortcuts")),
+        ]:
+            group.append(
+                Gtk.ShortcutsShortcut(accelerator=accel, title=title, visible=True)
+            )
+        section.append(group)
+        dialog.append(section)
+        return dialog
 
     def _on_about(self, *_args):
+        if self._about_dialog is None:
+            self._about_dialog = self._build_about_dialog()
+        self._about_dialog.present(self.window)
+
+    def _build_about_dialog(self):
         from . import __version__
-        dialog = Adw.AboutDialog(
+        return Adw.AboutDialog(
             application_name=_("RPM Policy Checker"),
             application_icon="package-x-generic-symbolic",
             version=__version__,
@@ -980,7 +1349,6 @@ class RPMPolicyCheckerApp(Adw.Application):
                 "and RPM standards with clear reports and fix suggestions."
             ),
         )
-        dialog.present(self.window)
 
     def _on_quit(self, *_args):
         self.quit()
@@ -1002,8 +1370,14 @@ def _save_session(window, app_name):
         "maximized": window.is_maximized(),
     }
     try:
-        with open(os.path.join(config_dir, "session.json"), "w") as f:
-            json.dump(state, f)
+        fd, tmp = tempfile.mkstemp(dir=config_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp, os.path.join(config_dir, "session.json"))
+        except OSError:
+            os.unlink(tmp)
+            raise
     except OSError:
         pass
 